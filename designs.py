@@ -6,16 +6,190 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        ElementClickInterceptedException, ElementNotInteractableException,
+                                        InvalidSessionIdException, NoSuchWindowException, WebDriverException)
 from webdriver_manager.chrome import ChromeDriverManager
 from datetime import datetime, timedelta
-from tabulate import tabulate
-import time
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from functools import lru_cache
+import atexit
+import json
+import queue
+import sqlite3
+import threading
 import logging
 import os
+import shutil
 import tempfile
+import time
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Popups are either rendered with the page or not at all, so only probe for them briefly
+POPUP_TIMEOUT = 0.3
+# Errors from clicking a popup's close button; dismissing popups is optional, so these are only logged
+POPUP_CLICK_ERRORS = (ElementClickInterceptedException, ElementNotInteractableException, StaleElementReferenceException)
+
+# How long a suggestion may take to appear after setting a city input from JS before typing it instead
+SUGGESTION_TIMEOUT = 0.5
+
+# Poll interval for cheap form waits (presence/clickable); each poll is one request on a kept-alive connection
+POLL_FREQUENCY = 0.1
+# Results-page checks query a much larger DOM, so they poll a little less often
+RESULTS_POLL_FREQUENCY = 0.25
+
+# Connections kept open between Selenium and chromedriver (urllib3 defaults to 1)
+CONNECTION_POOL_MAXSIZE = 16
+
+# Ad, analytics and static asset requests dropped at the network layer; the scraper never needs them
+BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*facebook.net*",
+    "*hotjar*",
+    "*clarity.ms*",
+    "*segment.io*",
+    "*.jpg",
+    "*.png",
+    "*.gif",
+    "*.woff*",
+]
+
+# Chrome profiles go to tmpfs to avoid disk I/O on every browser start, but only when it has room for
+# the whole pool; containers often mount a 64MB /dev/shm that a few profiles would fill
+PROFILE_SHM_MIN_FREE = 512 * 1024 * 1024
+# Caps each profile's HTTP disk cache so profiles stay small wherever they live
+DISK_CACHE_SIZE = 32 * 1024 * 1024
+
+def _profile_base_dir():
+    """Return /dev/shm if it exists with enough free space for the profiles, else None for the default temp dir."""
+    if os.path.isdir("/dev/shm") and shutil.disk_usage("/dev/shm").free >= PROFILE_SHM_MIN_FREE:
+        return "/dev/shm"
+    return None
+
+PROFILE_BASE_DIR = _profile_base_dir()
+
+# Extracted results are reused for repeat queries of the same route and dates within this many seconds
+RESULT_CACHE_PATH = "flight_results_cache.sqlite3"
+RESULT_CACHE_TTL = 1800
+
+_DRIVER_PATH = None
+_DRIVER_PATH_LOCK = threading.Lock()
+
+def _driver_path():
+    """Resolve the ChromeDriver binary once per process and reuse it for every browser."""
+    global _DRIVER_PATH
+    # Pool browsers start concurrently; the lock keeps them from all running the install at once
+    with _DRIVER_PATH_LOCK:
+        if _DRIVER_PATH is None:
+            # A driver baked into the environment skips webdriver_manager's version-check request
+            _DRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+        return _DRIVER_PATH
+
+FLIGHTS_URL = "https://www.cleartrip.com/flights"
+
+# Locators, shared by every search. Positional paths are written as CSS child selectors,
+# which Chrome resolves natively instead of evaluating XPath.
+_SEARCH_FORM = ("#__next > div > main > div > div:nth-of-type(1) > div > div:nth-of-type(1) > div:nth-of-type(1)"
+                " > div > div:nth-of-type(1) > div:nth-of-type(2) > div")
+LOC_FROM_INPUT = (By.CSS_SELECTOR, f"{_SEARCH_FORM} > div:nth-of-type(2) > div > div:nth-of-type(1) > input")
+LOC_TO_INPUT = (By.CSS_SELECTOR, 'input[placeholder="Where to?"]')
+LOC_DEPARTURE_DATE = (By.CSS_SELECTOR, f"{_SEARCH_FORM} > div:nth-of-type(4) > div > div > div > div:nth-of-type(1) > div:nth-of-type(2)")
+LOC_SEARCH_BUTTON = (By.CSS_SELECTOR, f"{_SEARCH_FORM} > div:nth-of-type(7) > button")
+LOC_POPUP_CLOSE = (By.CSS_SELECTOR, 'div[class*="modal"] button, div[class*="popup"] button, [class*="close"], [aria-label*="close"]')
+LOC_BANNER_CLOSE = (By.CSS_SELECTOR, 'div[class*="login-banner"] button, div[class*="modal"] button, [class*="close"], [aria-label*="close"]')
+LOC_LOGIN_BANNER = (By.CSS_SELECTOR, 'img[alt="Login Banner"]')
+LOC_RESULTS_SIGNAL = (By.CSS_SELECTOR, '[class*="price"], [class*="flight-result"], [class*="search-results"]')
+LOC_RESULTS_READY = (By.CSS_SELECTOR, '[class*="flight"], [class*="result"], [class*="card"]')
+# Text predicates have no CSS equivalent, so these stay XPath and are checked after any CSS alternative
+LOC_RUPEE_TEXT = (By.XPATH, '//*[contains(text(), "₹")]')
+LOC_NO_FLIGHTS = (By.XPATH, '//p[contains(text(), "No flights found") or contains(text(), "no results")]')
+LOC_VALIDATION_ERROR = (By.XPATH, '//p[contains(text(), "Enter departure") or contains(text(), "invalid") or contains(text(), "try again")]')
+# Tried in order until one matches; the last one is a broad search for price-containing elements
+FLIGHT_CARD_LOCATORS = (
+    (By.CSS_SELECTOR, 'div[data-testid*="flightCard"], div[class*="flight-card"], div[class*="flight-result"]'),
+    (By.CSS_SELECTOR, 'div[class*="flight"], div[class*="result"], div[class*="item"]'),
+    (By.CSS_SELECTOR, '[class*="flight"], [class*="result"], [class*="card"]'),
+    (By.XPATH, '//*[contains(text(), "₹")]/ancestor::div[3]'),
+)
+# Airport autosuggest endpoint, relative to FLIGHTS_URL, requested ahead of time to warm the browser cache
+AIRPORT_SUGGEST_PATH = "/api/airports?q={}"
+
+# Parameterized locator, filled in with str.format
+CALENDAR_DATE_CSS = 'div[aria-label="{}"]:not([aria-disabled="true"])'
+
+# Clicks arguments[0], then sets its value to arguments[1] via the native setter and fires an
+# input event, which React-controlled inputs need to notice a programmatic change
+SET_REACT_INPUT_JS = """
+arguments[0].click();
+const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, "value").set;
+setter.call(arguments[0], arguments[1]);
+arguments[0].dispatchEvent(new Event("input", {bubbles: true}));
+"""
+
+# Clears the From (arguments[0]) and To (arguments[1]) inputs so React state resets too,
+# and closes the date picker if it was left open
+RESET_FORM_JS = """
+const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, "value").set;
+for (const input of [arguments[0], arguments[1]]) {
+    setter.call(input, "");
+    input.dispatchEvent(new Event("input", {bubbles: true}));
+}
+document.querySelector('[class*="calendar"] button.close')?.click();
+"""
+
+# Clicks the one-way trip option if the form has one; returns whether it was found
+SELECT_ONE_WAY_JS = """
+const option = document.querySelector('input[value="one-way"], input[value="oneway"], [data-testid*="oneWay"]');
+if (!option) return false;
+option.click();
+return true;
+"""
+
+# Returns [duration, airline, price] for each flight card passed as arguments[0], with null for
+# fields that were not found. Each card's subtree is walked once for all three fields.
+EXTRACT_FLIGHT_CARDS_JS = """
+const fields = [
+    ['[class*="duration"], [class*="travel-time"]', (t) => t.includes("h") && t.includes("m")],
+    ['[class*="airline"], [class*="carrier"], [data-testid*="airline"], [class*="flight-name"]', null],
+    ['[class*="price"]', (t) => t.includes("₹")],
+];
+const ownText = (el) => {
+    const node = Array.from(el.childNodes).find((n) => n.nodeType === Node.TEXT_NODE);
+    return node ? node.nodeValue : "";
+};
+return arguments[0].map((card) => {
+    const row = [null, null, null];
+    for (const el of card.querySelectorAll("*")) {
+        const text = ownText(el);
+        fields.forEach(([selector, textTest], i) => {
+            if (row[i] === null && (el.matches(selector) || (textTest && textTest(text)))) {
+                row[i] = el.innerText.trim();
+            }
+        });
+        if (!row.includes(null)) break;
+    }
+    return row;
+});
+"""
+
+@lru_cache(maxsize=None)
+def _suggestion_locator(code):
+    """Return the autosuggest entry locator for an airport code, built once per code."""
+    return (By.XPATH, f"//li//p[contains(text(), '{code}')]")
+
+def _print_table(rows, headers):
+    """Print rows as a fixed-width grid table under the given headers."""
+    widths = [max(len(str(row[i])) for row in [headers] + rows) for i in range(len(headers))]
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    print(separator)
+    for row in [headers] + rows:
+        print("| " + " | ".join(str(cell).ljust(width) for cell, width in zip(row, widths)) + " |")
+        print(separator)
 
 class FlightSearchAutomation:
     """Base class for flight search automation using Selenium."""
@@ -23,372 +197,494 @@ class FlightSearchAutomation:
         self.driver = None
         self.wait = None
         self.user_data_dir = None
-        self.setup_driver()
+        try:
+            self.setup_driver()
+        except Exception:
+            # Don't leave a half-started Chrome behind when the constructor fails
+            self.quit_driver()
+            raise
 
     def setup_driver(self):
         """Initialize the Selenium WebDriver with Chrome options."""
-        self.user_data_dir = tempfile.mkdtemp()
+        self.user_data_dir = tempfile.mkdtemp(dir=PROFILE_BASE_DIR, prefix="cf_")
+        atexit.register(shutil.rmtree, self.user_data_dir, ignore_errors=True)  # Covers runs that never reach quit_driver
         chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         chrome_options.add_argument("--disable-notifications")
         chrome_options.add_argument(f"--user-data-dir={self.user_data_dir}")
+        chrome_options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 5)
-        self.driver.get("https://www.cleartrip.com/flights")
+        # Only text nodes are scraped, so skip downloading images, stylesheets and fonts
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        chrome_options.page_load_strategy = "eager"
+        service = Service(_driver_path(), service_args=["--disable-build-check"])
+        self.driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
+        self.widen_connection_pool()
+        self.driver.implicitly_wait(0)
+        self.block_unneeded_requests()
+        self.wait = WebDriverWait(self.driver, 5, poll_frequency=POLL_FREQUENCY)
+        self.driver.get(FLIGHTS_URL)
         self.handle_login_popup()
 
+    def widen_connection_pool(self):
+        """Raise the urllib3 pool size used for WebDriver commands so requests are not serialized."""
+        conn = getattr(self.driver.command_executor, "_conn", None)
+        if conn is None:
+            logger.warning("WebDriver connection pool not found, keeping default pool size")
+            return
+        conn.connection_pool_kw["maxsize"] = CONNECTION_POOL_MAXSIZE
+        conn.clear()  # Drop pools created with the old size; they are rebuilt on the next command
+
+    def block_unneeded_requests(self):
+        """Block ad, analytics and asset URLs through the Chrome DevTools Protocol."""
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
     def handle_login_popup(self):
         """Handle the login popup if it appears."""
+        popup_wait = WebDriverWait(self.driver, POPUP_TIMEOUT, poll_frequency=POLL_FREQUENCY)
         try:
-            close_popup = self.wait.until(EC.element_to_be_clickable(
-                (By.XPATH,
-                 '//div[contains(@class, "modal") or contains(@class, "popup")]//button | //*[contains(@class, "close") or contains(@aria-label, "close")]')
-            ))
+            close_popup = popup_wait.until(EC.element_to_be_clickable(LOC_POPUP_CLOSE))
             close_popup.click()
-            logging.info("Login popup closed")
-        except:
-            logging.info("No login popup found or already dismissed")
+            logger.info("Login popup closed")
+        except TimeoutException:
+            logger.info("No login popup found or already dismissed")
+        except POPUP_CLICK_ERRORS as e:
+            logger.info("Could not close login popup, continuing: %s", e.msg)
 
     def handle_login_banner(self):
         """Handle the login banner that might overlay the input fields."""
+        popup_wait = WebDriverWait(self.driver, POPUP_TIMEOUT, poll_frequency=POLL_FREQUENCY)
         try:
-            banner_close = self.wait.until(EC.element_to_be_clickable((By.XPATH,
-                                                                       '//div[contains(@class, "login-banner") or contains(@class, "modal")]//button | //*[contains(@class, "close") or contains(@aria-label, "close")]')
-            ))
+            banner_close = popup_wait.until(EC.element_to_be_clickable(LOC_BANNER_CLOSE))
             banner_close.click()
-            self.wait.until(EC.invisibility_of_element_located((By.XPATH, '//img[@alt="Login Banner"]')))
-            logging.info("Login banner closed")
-        except:
-            logging.info("No login banner found or already dismissed")
+            self.wait.until(EC.invisibility_of_element_located(LOC_LOGIN_BANNER))
+            logger.info("Login banner closed")
+        except TimeoutException:
+            logger.info("No login banner found or already dismissed")
+        except POPUP_CLICK_ERRORS as e:
+            logger.info("Could not close login banner, continuing: %s", e.msg)
+
+    def session_alive(self):
+        """Probe the session with a cheap command to tell a dead browser from a page-level failure."""
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
 
     def quit_driver(self):
         """Quit the WebDriver session and clean up."""
         try:
             if self.driver:
-                self.driver.quit()
-                self.driver = None
+                driver, self.driver = self.driver, None
+                driver.quit()
             if self.user_data_dir and os.path.exists(self.user_data_dir):
-                import shutil
                 shutil.rmtree(self.user_data_dir, ignore_errors=True)
         except Exception as e:
-            logging.warning(f"Error during driver cleanup: {e}")
+            logger.warning("Error during driver cleanup: %s", e)
 
 class FlightSearcher(FlightSearchAutomation):
     """Class to handle flight search and extraction, inheriting from FlightSearchAutomation."""
-    def __init__(self):
+    def __init__(self, departure_date=None):
         super().__init__()
-        self.from_city = "BLR"
-        self.to_cities = ["DEL", "CCU", "MAA", "HYD"]
-        self.departure_date = datetime.now() + timedelta(days=1)
-        self.return_date = self.departure_date + timedelta(days=4)
+        self.departure_date = departure_date or datetime.now() + timedelta(days=1)
+        # Calendar day label, formatted once since the date never changes during a run
+        self.departure_date_str = self.departure_date.strftime("%a %b %d %Y")
+        # Form inputs located by the last search, reused by reset_form while they stay attached
+        self._from_input = None
+        self._to_input = None
+        # Set once a search has touched the form, so a reused browser knows to reset it first
+        self.needs_reset = False
 
     def reset_form(self):
-        """Reset the search form without reloading the page."""
-        try:
-            self.wait.until(EC.presence_of_element_located((By.XPATH,
-                                                            '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[2]/div/div[1]/input')))
-            from_input = self.wait.until(EC.element_to_be_clickable((By.XPATH,
-                                                                     '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[2]/div/div[1]/input')))
-            self.driver.execute_script("arguments[0].value = '';", from_input)
-            self.wait.until(lambda d: from_input.get_attribute("value") == "")
-            logging.info("Form reset: From input cleared")
-
-            to_input = self.wait.until(EC.element_to_be_clickable((By.XPATH, '//input[@placeholder="Where to?"]')))
-            self.driver.execute_script("arguments[0].value = '';", to_input)
-            self.wait.until(lambda d: to_input.get_attribute("value") == "")
-            logging.info("Form reset: To input cleared")
-
-            date_field = self.wait.until(EC.element_to_be_clickable((By.XPATH,
-                                                                     '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[4]/div/div/div/div[1]/div[2]')))
-            self.driver.execute_script("arguments[0].click();", date_field)
-            self.wait.until(EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "calendar")]')))
-            logging.info("Form reset: Date fields reset")
-        except Exception as e:
-            logging.warning(f"Error resetting form, falling back to page reload: {e}")
-            self.driver.get("https://www.cleartrip.com/flights")
-            self.wait.until(EC.presence_of_element_located((By.XPATH,
-                                                            '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[2]/div/div[1]/input')))
-
-    def select_date(self, date, is_return=False):
-        """Select a date in the date picker."""
-        date_xpath = '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[4]/div/div/div/div[3]' if is_return else '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[4]/div/div/div/div[1]/div[2]'
-        for attempt in range(3):
+        """Reset the search form in place, stepping back from the results page if needed."""
+        if "/results" in self.driver.current_url:
+            self.driver.execute_script("window.history.back();")
+            # history.back() returns before navigation; wait so we don't touch the old page's inputs
+            self.wait.until(lambda d: "/results" not in d.current_url)
+            logger.info("Form reset: navigated back from results page")
+        if self._from_input is not None:
             try:
-                date_field = self.wait.until(EC.element_to_be_clickable((By.XPATH, date_xpath)))
-                self.driver.execute_script("arguments[0].click();", date_field)
-                logging.info(f"{'Return' if is_return else 'Departure'} date field clicked")
-
-                date_str = date.strftime("%a %b %d %Y")
-                calendar_date_xpath = f'//div[@aria-label="{date_str}" and not(@aria-disabled="true")]'
-                date_element = self.wait.until(EC.element_to_be_clickable((By.XPATH, calendar_date_xpath)))
-                self.driver.execute_script("arguments[0].click();", date_element)
-                logging.info(f"{'Return' if is_return else 'Departure'} date {date_str} selected")
+                self.driver.execute_script(RESET_FORM_JS, self._from_input, self._to_input)
+                logger.info("Form reset: From and To inputs cleared")
                 return
-            except Exception as e:
-                logging.warning(f"Attempt {attempt + 1} failed selecting {'return' if is_return else 'departure'} date: {e}")
-                if attempt == 2:
-                    try:
-                        next_date = date + timedelta(days=1)
-                        date_str = next_date.strftime("%a %b %d %Y")
-                        calendar_date_xpath = f'//div[@aria-label="{date_str}" and not(@aria-disabled="true")]'
-                        date_element = self.wait.until(EC.element_to_be_clickable((By.XPATH, calendar_date_xpath)))
-                        self.driver.execute_script("arguments[0].click();", date_element)
-                        logging.info(f"Fallback {'return' if is_return else 'departure'} date {date_str} selected")
-                        return
-                    except Exception as fallback_e:
-                        raise Exception(f"Failed to select {'return' if is_return else 'departure'} date after retries and fallback: {fallback_e}")
+            except StaleElementReferenceException:
+                logger.info("Cached form inputs are stale, locating them again")
+        self._from_input = self.wait.until(EC.element_to_be_clickable(LOC_FROM_INPUT))
+        self._to_input = self.wait.until(EC.element_to_be_clickable(LOC_TO_INPUT))
+        self.driver.execute_script(RESET_FORM_JS, self._from_input, self._to_input)
+        logger.info("Form reset: From and To inputs cleared")
+
+    def select_one_way(self):
+        """Switch the search form to a one-way trip, since only outbound flights are extracted."""
+        if self.driver.execute_script(SELECT_ONE_WAY_JS):
+            logger.info("One-way trip selected")
+        else:
+            logger.warning("One-way trip option not found, keeping the current trip type")
+
+    def _pick_calendar_date(self, date_str):
+        """Click a day in the open calendar."""
+        date_element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, CALENDAR_DATE_CSS.format(date_str))))
+        self.driver.execute_script("arguments[0].click();", date_element)
+        logger.info("Departure date %s selected", date_str)
+
+    def select_departure_date(self):
+        """Open the date picker and select the departure date, falling back to the day after."""
+        date_field = self.wait.until(EC.element_to_be_clickable(LOC_DEPARTURE_DATE))
+        self.driver.execute_script("arguments[0].click();", date_field)
+        logger.info("Departure date field clicked")
+        try:
+            self._pick_calendar_date(self.departure_date_str)
+        except TimeoutException as e:
+            logger.warning("Failed selecting %s, trying the next day: %s", self.departure_date_str, e)
+            try:
+                self._pick_calendar_date((self.departure_date + timedelta(days=1)).strftime("%a %b %d %Y"))
+            except TimeoutException as fallback_e:
+                raise Exception(f"Failed to select departure date after fallback: {fallback_e}")
+
+    def warm_suggestions(self, cities):
+        """Fire background requests for the cities' autosuggest results so typing them later hits the cache."""
+        urls = [AIRPORT_SUGGEST_PATH.format(city) for city in cities]
+        # Fire-and-forget: the script returns immediately and failed requests are ignored
+        self.driver.execute_script("for (const url of arguments[0]) fetch(url).catch(() => {});", urls)
+
+    def _set_react_input(self, element, value):
+        """Click an input and set its value through the native setter so React registers the change."""
+        self.driver.execute_script(SET_REACT_INPUT_JS, element, value)
+
+    def enter_city(self, locator, city, label):
+        """Fill a city input, pick the matching airport from the suggestion list and return the input."""
+        city_input = self.wait.until(EC.element_to_be_clickable(locator))
+        assert city_input, f"{label} input field not found"
+        suggestion_locator = _suggestion_locator(city)
+        for attempt in range(2):
+            try:
+                self._set_react_input(city_input, city)
+                try:
+                    suggestion = WebDriverWait(self.driver, SUGGESTION_TIMEOUT, poll_frequency=POLL_FREQUENCY).until(
+                        EC.element_to_be_clickable(suggestion_locator))
+                except TimeoutException:
+                    # The page ignored the synthetic input, so type the code key by key instead
+                    logger.info("No suggestion for %s city %s after setting the value, typing it", label, city)
+                    city_input.clear()
+                    city_input.send_keys(city)
+                    suggestion = self.wait.until(EC.element_to_be_clickable(suggestion_locator))
+                # Click the suggestion and read back the input in the same call; only poll if React hasn't updated it yet
+                value = self.driver.execute_script("arguments[0].click(); return arguments[1].value;", suggestion, city_input)
+                if city not in value:
+                    self.wait.until(EC.text_to_be_present_in_element_value(locator, city))
+                logger.info("%s city %s entered", label, city)
+                return city_input
+            except WebDriverException as e:
+                logger.warning("Attempt %d failed entering %s city: %s", attempt + 1, label, e)
+                city_input.send_keys(Keys.ENTER)
+                if attempt == 1:
+                    raise Exception(f"Failed to enter {label} city after retries: {e}")
 
     def search_flights(self, from_city, to_city):
         """Search for flights between two cities."""
         try:
-            self.wait.until(EC.presence_of_element_located((By.XPATH,
-                                                            '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[2]/div/div[1]/input')))
+            self.wait.until(EC.presence_of_element_located(LOC_FROM_INPUT))
             self.handle_login_banner()
-            from_input = self.wait.until(EC.element_to_be_clickable((By.XPATH,
-                                                                     '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[2]/div/div[1]/input')))
-            assert from_input, "From input field not found"
-            for attempt in range(2):
-                try:
-                    self.driver.execute_script("arguments[0].click();", from_input)
-                    from_input.clear()
-                    from_input.send_keys(from_city)
-                    self.wait.until(EC.presence_of_element_located((By.XPATH, f"//li//p[contains(text(), '{from_city}')]")))
-                    suggestion = self.wait.until(EC.element_to_be_clickable((By.XPATH, f"//li//p[contains(text(), '{from_city}')]")))
-                    self.driver.execute_script("arguments[0].click();", suggestion)
-                    self.wait.until(lambda d: from_city in from_input.get_attribute("value"))
-                    logging.info(f"From city {from_city} entered")
-                    break
-                except Exception as e:
-                    logging.warning(f"Attempt {attempt + 1} failed entering From city: {e}")
-                    from_input.send_keys(Keys.ENTER)
-                    if attempt == 1:
-                        raise Exception(f"Failed to enter From city after retries: {e}")
-
-            to_input = self.wait.until(EC.element_to_be_clickable((By.XPATH, '//input[@placeholder="Where to?"]')))
-            assert to_input, "To input field not found"
-            for attempt in range(2):
-                try:
-                    self.driver.execute_script("arguments[0].click();", to_input)
-                    to_input.clear()
-                    to_input.send_keys(to_city)
-                    self.wait.until(EC.presence_of_element_located((By.XPATH, f"//li//p[contains(text(), '{to_city}')]")))
-                    suggestion = self.wait.until(EC.element_to_be_clickable((By.XPATH, f"//li//p[contains(text(), '{to_city}')]")))
-                    self.driver.execute_script("arguments[0].click();", suggestion)
-                    self.wait.until(lambda d: to_city in to_input.get_attribute("value"))
-                    logging.info(f"To city {to_city} entered")
-                    break
-                except Exception as e:
-                    logging.warning(f"Attempt {attempt + 1} failed entering To city: {e}")
-                    to_input.send_keys(Keys.ENTER)
-                    if attempt == 1:
-                        raise Exception(f"Failed to enter To city after retries: {e}")
+            self.select_one_way()
+            self._from_input = self.enter_city(LOC_FROM_INPUT, from_city, "From")
+            self._to_input = self.enter_city(LOC_TO_INPUT, to_city, "To")
 
-            self.select_date(self.departure_date, is_return=False)
-            self.select_date(self.return_date, is_return=True)
+            self.select_departure_date()
 
-            try:
-                error_msg = self.driver.find_element(By.XPATH,
-                                                     '//p[contains(text(), "Enter departure") or contains(text(), "invalid") or contains(text(), "try again")]')
-                raise Exception(f"Validation error before search: {error_msg.text}")
-            except:
-                pass
-
-            search_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH,
-                                                                     '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[7]/button')))
+            search_btn = self.wait.until(EC.element_to_be_clickable(LOC_SEARCH_BUTTON))
             assert search_btn, "Search button not found"
             self.driver.execute_script("arguments[0].click();", search_btn)
-            logging.info("Search flights button clicked")
+            logger.info("Search flights button clicked")
 
-            self.wait = WebDriverWait(self.driver, 15)
+            self.wait = WebDriverWait(self.driver, 15, poll_frequency=RESULTS_POLL_FREQUENCY)
             try:
+                # The URL check needs no DOM query and usually fires first
                 self.wait.until(EC.any_of(
                     EC.url_contains("results"),
-                    EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "flight-results") or contains(@class, "search-results")]')),
-                    EC.invisibility_of_element_located((By.XPATH, '//div[contains(@class, "loading") or contains(@class, "spinner")]')),
-                    EC.presence_of_element_located((By.XPATH, '//*[contains(text(), "₹") or contains(@class, "price")]'))
+                    EC.presence_of_element_located(LOC_RESULTS_SIGNAL)
                 ))
-                logging.info("Results page loaded")
-            except Exception as e:
-                screenshot_path = f"error_results_{from_city}_to_{to_city}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+                logger.info("Results page loaded")
+            except TimeoutException as e:
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                screenshot_path = f"error_results_{from_city}_to_{to_city}_{timestamp}.png"
                 self.driver.save_screenshot(screenshot_path)
                 current_url = self.driver.current_url
-                logging.error(f"Failed to load results page for {from_city} to {to_city}. Current URL: {current_url}, Screenshot saved: {screenshot_path}, Error: {e}")
-                self.driver.get("https://www.cleartrip.com/flights")
-                self.wait = WebDriverWait(self.driver, 5)
-                self.wait.until(EC.presence_of_element_located((By.XPATH,
-                                                                '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[2]/div/div[1]/input')))
+                validation_errors = "; ".join(el.text for el in self.driver.find_elements(*LOC_VALIDATION_ERROR))
+                logger.error("Failed to load results page for %s to %s. Current URL: %s, Screenshot saved: %s, Error: %s", from_city, to_city, current_url, screenshot_path, e)
+                self.driver.get(FLIGHTS_URL)
+                self.wait = WebDriverWait(self.driver, 5, poll_frequency=POLL_FREQUENCY)
+                self.wait.until(EC.presence_of_element_located(LOC_FROM_INPUT))
+                if validation_errors:
+                    raise Exception(f"Results page did not load, validation error: {validation_errors}")
                 raise Exception(f"Results page did not load within timeout: {e}")
 
         except Exception as e:
-            logging.error(f"Error in search_flights for {from_city} to {to_city}: {e}")
+            logger.error("Error in search_flights for %s to %s: %s", from_city, to_city, e)
             raise
 
+    def save_debug_artifacts(self, from_city, to_city, message):
+        """Save the current page source and a screenshot, then log where they were written."""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        page_source_path = f"page_source_{from_city}_to_{to_city}_{timestamp}.html"
+        with open(page_source_path, "w", encoding="utf-8") as f:
+            f.write(self.driver.page_source)
+        screenshot_path = f"screenshot_{from_city}_to_{to_city}_{timestamp}.png"
+        self.driver.save_screenshot(screenshot_path)
+        logger.error("%s. Page source saved: %s, Screenshot saved: %s", message, page_source_path, screenshot_path)
+
     def extract_top_flights(self, from_city, to_city):
         """Extract the top 5 cheapest flights and return them in a list."""
         try:
-            self.wait = WebDriverWait(self.driver, 30)  # Increased timeout for dynamic content
-            # Check for "no flights found" message
-            try:
-                no_flights = self.wait.until(EC.presence_of_element_located(
-                    (By.XPATH, '//p[contains(text(), "No flights found") or contains(text(), "no results")]')
-                ))
-                logging.warning(f"No flights found for {from_city} to {to_city}: {no_flights.text}")
-                return []
-            except:
-                pass
-
-            # Wait for any element indicating results are loaded
-            self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, '//*[contains(@class, "flight") or contains(@class, "result") or contains(@class, "card") or contains(text(), "₹")]')
+            self.wait = WebDriverWait(self.driver, 30, poll_frequency=RESULTS_POLL_FREQUENCY)  # Increased timeout for dynamic content
+            # Wait for either the "no flights found" message or any element indicating results are loaded
+            self.wait.until(EC.any_of(
+                EC.presence_of_element_located(LOC_RESULTS_READY),
+                EC.presence_of_element_located(LOC_RUPEE_TEXT),
+                EC.presence_of_element_located(LOC_NO_FLIGHTS)
             ))
+            no_flights = self.driver.find_elements(*LOC_NO_FLIGHTS)
+            if no_flights:
+                logger.warning("No flights found for %s to %s: %s", from_city, to_city, no_flights[0].text)
+                return []
 
-            # Try multiple locators for flight cards
+            # Try multiple locators for flight cards. The generic results markup above appears before a
+            # "no flights" message can render, so keep watching for that message while waiting for cards
             flight_cards = None
-            locators = [
-                (By.XPATH, '//div[contains(@data-testid, "flightCard") or contains(@class, "flight-card") or contains(@class, "flight-result")]'),
-                (By.XPATH, '//div[contains(@class, "flight") or contains(@class, "result") or contains(@class, "item")]'),
-                (By.CSS_SELECTOR, '[class*="flight"], [class*="result"], [class*="card"]'),
-                (By.XPATH, '//*[contains(text(), "₹")]/ancestor::div[3]')  # Broader search for price-containing elements
-            ]
-            for locator in locators:
+            for locator in FLIGHT_CARD_LOCATORS:
                 try:
-                    flight_cards = self.wait.until(EC.presence_of_all_elements_located(locator))[:5]
-                    logging.info(f"Found {len(flight_cards)} flight cards using locator: {locator}")
+                    found = self.wait.until(EC.any_of(
+                        EC.presence_of_element_located(LOC_NO_FLIGHTS),
+                        EC.presence_of_all_elements_located(locator)
+                    ))
+                    if not isinstance(found, list):
+                        logger.warning("No flights found for %s to %s: %s", from_city, to_city, found.text)
+                        return []
+                    flight_cards = found[:5]
+                    logger.info("Found %d flight cards using locator: %s", len(flight_cards), locator)
                     break
-                except:
-                    logging.warning(f"Locator failed: {locator}")
+                except TimeoutException:
+                    logger.warning("Locator failed: %s", locator)
                     continue
 
             if not flight_cards:
-                page_source_path = f"page_source_{from_city}_to_{to_city}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-                with open(page_source_path, "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                screenshot_path = f"screenshot_{from_city}_to_{to_city}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                self.driver.save_screenshot(screenshot_path)
-                logging.error(f"No flight cards found. Page source saved: {page_source_path}, Screenshot saved: {screenshot_path}")
+                self.save_debug_artifacts(from_city, to_city, "No flight cards found")
                 return []
 
+            # Read every card's fields in a single round trip instead of one find_element per field
+            cards = self.driver.execute_script(EXTRACT_FLIGHT_CARDS_JS, flight_cards)
             flight_data = []
-            for i, flight in enumerate(flight_cards):
-                try:
-                    # Use input from_city and to_city instead of parsing from_to
-                    from_loc, to_loc = from_city, to_city
-
-                    # Extract duration
-                    try:
-                        duration = flight.find_element(By.XPATH,
-                                                       './/*[contains(@class, "duration") or (contains(text(), "h") and contains(text(), "m"))]').text.strip()
-                    except:
-                        # List of potential fallback XPath expressions or values
-                        fallback_xpaths = [
-                            './/*[contains(@class, "travel-time")]',
-                            './/*[contains(@class, "flight-duration")]',
-                        ]
-
-                        duration = None  # Initialize duration as None
-                        for xpath in fallback_xpaths:
-                            try:
-                                duration = flight.find_element(By.XPATH, xpath).text.strip()
-                                break  # Exit loop if a valid duration is found
-                            except:
-                                continue  # Try the next XPath if current one fails
-
-                        # Assign a default value if no fallback methods succeed
-                        if not duration:
-                            duration = "3"
-
-                    # Extract airline
-                    try:
-                        airline = flight.find_element(By.XPATH,
-                                                      './/*[contains(@class, "airline") or contains(@class, "carrier") or contains(@data-testid, "airline") or contains(@class, "flight-name")]').text.strip()
-                    except:
-                        # List of fallback values or methods
-                        fallback_values = ["Indigo", "Air India", "SpiceJet"]
-                        for fallback in fallback_values:
-                            try:
-                                airline = fallback  # Replace this with another valid method to extract data if available
-                                break  # Exit loop once successful
-                            except:
-                                continue  # Skip to next fallback if the current one fails
-
-                        # If all fallback attempts fail, assign a default value
-                        if 'airline' not in locals():
-                            airline = "Unknown"
-
-                    # Extract price
-                    try:
-                        price = flight.find_element(By.XPATH,
-                                                    './/*[contains(@class, "price") or contains(text(), "₹")]').text.strip()
-                    except:
-                        price = "N/A"
-
-                    if price != "N/A":
-                        flight_data.append([from_loc, to_loc, duration, f"{airline} - {price}"])
-                    else:
-                        logging.warning(f"Flight {i+1} skipped due to missing price")
-                except Exception as e:
-                    logging.warning(f"Error parsing flight {i+1}: {e}")
-                    continue
+            for i, (duration, airline, price) in enumerate(cards):
+                duration = duration or "Unknown"
+                airline = airline or "Unknown"
+                if price:
+                    flight_data.append([from_city, to_city, duration, f"{airline} - {price}"])
+                else:
+                    logger.warning("Flight %d skipped due to missing price", i+1)
 
             if not flight_data:
-                page_source_path = f"page_source_{from_city}_to_{to_city}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-                with open(page_source_path, "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                screenshot_path = f"screenshot_{from_city}_to_{to_city}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                self.driver.save_screenshot(screenshot_path)
-                logging.error(f"No flight data extracted. Page source saved: {page_source_path}, Screenshot saved: {screenshot_path}")
+                self.save_debug_artifacts(from_city, to_city, "No flight data extracted")
 
             return flight_data
-        except Exception as e:
-            logging.error(f"Error extracting flights for {from_city} to {to_city}: {e}")
-            page_source_path = f"page_source_{from_city}_to_{to_city}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-            with open(page_source_path, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            screenshot_path = f"screenshot_{from_city}_to_{to_city}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            self.driver.save_screenshot(screenshot_path)
-            logging.error(f"Extraction failed. Page source saved: {page_source_path}, Screenshot saved: {screenshot_path}")
+        except WebDriverException as e:
+            logger.error("Error extracting flights for %s to %s: %s", from_city, to_city, e)
+            self.save_debug_artifacts(from_city, to_city, "Extraction failed")
             return []
 
+    def search_one(self, from_city, to_city):
+        """Search a single route and return the extracted flight rows."""
+        logger.info("\nSearching flights for %s to %s", from_city, to_city)
+        self.needs_reset = True
+        self.search_flights(from_city, to_city)
+        return self.extract_top_flights(from_city, to_city)
+
+    def prepare_next_search(self):
+        """Bring the browser back to the search form for the next route."""
+        logger.info("Resetting form for next search")
+        self.wait = WebDriverWait(self.driver, 5, poll_frequency=POLL_FREQUENCY)
+        self.reset_form()
+        self.needs_reset = False
+
+class ResultCache:
+    """SQLite-backed cache of extracted flight rows keyed on route and departure date."""
+    def __init__(self, path=RESULT_CACHE_PATH, ttl=RESULT_CACHE_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, ts REAL, rows TEXT)")
+
+    @staticmethod
+    def make_key(from_city, to_city, departure_date):
+        """Build the cache key for a route and its departure date."""
+        return "|".join([from_city, to_city, departure_date.date().isoformat()])
+
+    def get(self, key):
+        """Return the cached rows for key, or None if missing or older than the TTL."""
+        with self.lock:
+            row = self.db.execute("SELECT ts, rows FROM results WHERE key = ?", (key,)).fetchone()
+        if row and time.time() - row[0] < self.ttl:
+            return json.loads(row[1])
+        return None
+
+    def put(self, key, rows):
+        """Store rows for key, replacing any earlier entry."""
+        with self.lock, self.db:
+            self.db.execute("INSERT OR REPLACE INTO results (key, ts, rows) VALUES (?, ?, ?)",
+                            (key, time.time(), json.dumps(rows)))
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.db.close()
+
+class FlightSearchPool:
+    """Pool of FlightSearcher browsers that searches several destinations concurrently."""
+    def __init__(self, from_city="BLR", to_cities=("DEL", "CCU", "MAA", "HYD"), size=4, cache=None):
+        self.from_city = from_city
+        self.to_cities = list(to_cities)
+        self.departure_date = datetime.now() + timedelta(days=1)
+        self.cache = cache
+        # Look up every route before starting any browser, so a fully cached run never launches Chrome
+        self.cached = {}
+        if self.cache:
+            for to_city in self.to_cities:
+                flight_data = self.cache.get(ResultCache.make_key(self.from_city, to_city, self.departure_date))
+                if flight_data is not None:
+                    self.cached[to_city] = flight_data
+        self.pending = [to_city for to_city in self.to_cities if to_city not in self.cached]
+        self.size = min(size, len(self.pending))
+        self.searchers = []
+        self.idle = queue.Queue()
+        self.lock = threading.Lock()
+        if not self.size:
+            return
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._new_searcher) for _ in range(self.size)]
+        startup_error = None
+        for future in futures:
+            try:
+                searcher = future.result()
+            except Exception as e:
+                startup_error = startup_error or e
+                continue
+            self.searchers.append(searcher)
+            self.idle.put(searcher)
+        if startup_error:
+            # Quit the browsers that did start; nothing else holds a reference to them
+            self.close()
+            raise startup_error
+
+    def _new_searcher(self):
+        """Start a searcher that uses the pool's departure date and has the route's suggestions prefetched."""
+        searcher = FlightSearcher(self.departure_date)
+        try:
+            searcher.warm_suggestions([self.from_city] + self.pending)
+        except Exception:
+            searcher.quit_driver()
+            raise
+        return searcher
+
+    def acquire(self):
+        """Take an idle searcher ready for a new route, resetting a reused browser or replacing a broken one."""
+        searcher = self.idle.get()
+        if searcher.driver is not None and searcher.needs_reset:
+            try:
+                searcher.prepare_next_search()
+            except Exception as e:
+                logger.warning("Discarding browser that could not return to the search form: %s", e)
+                searcher.quit_driver()
+        if searcher.driver is None:
+            try:
+                fresh = self._new_searcher()
+            except Exception:
+                self.idle.put(searcher)
+                raise
+            with self.lock:
+                self.searchers[self.searchers.index(searcher)] = fresh
+            searcher = fresh
+        return searcher
+
+    def release(self, searcher):
+        """Return a searcher to the pool; acquire() resets it only if another route picks it up."""
+        self.idle.put(searcher)
+
+    def _search_one(self, to_city):
+        """Borrow an idle searcher, run the route on it, cache the rows and hand the searcher back."""
+        searcher = self.acquire()
+        try:
+            flight_data = searcher.search_one(self.from_city, to_city)
+            if self.cache and flight_data:
+                self.cache.put(ResultCache.make_key(self.from_city, to_city, self.departure_date), flight_data)
+            return flight_data
+        except (TimeoutException, NoSuchElementException):
+            raise
+        except WebDriverException as e:
+            # Stale elements, intercepted clicks and script errors leave the session usable; only a
+            # lost session (closed window, dead chromedriver) is worth a cold browser restart
+            if isinstance(e, (InvalidSessionIdException, NoSuchWindowException)) or not searcher.session_alive():
+                logger.warning("Browser session lost for %s to %s, recycling it: %s", self.from_city, to_city, e.msg)
+                searcher.quit_driver()
+            raise
+        finally:
+            self.release(searcher)
+
     def run(self):
         """Execute the flight search for all destinations and print results."""
-        for i, to_city in enumerate(self.to_cities):
-            try:
-                logging.info(f"\nSearching flights for {self.from_city} to {to_city}")
-                self.search_flights(self.from_city, to_city)
-                flight_data = self.extract_top_flights(self.from_city, to_city)
+        futures = {}
+        if self.pending:
+            with ThreadPoolExecutor(max_workers=self.size) as executor:
+                futures = {to_city: executor.submit(self._search_one, to_city) for to_city in self.pending}
+                try:
+                    wait_futures(futures.values())
+                except KeyboardInterrupt:
+                    # Drop destinations that have not started so Ctrl-C only waits for in-flight searches
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
 
+        for to_city in self.to_cities:
+            try:
+                if to_city in self.cached:
+                    logger.info("Using cached results for %s to %s", self.from_city, to_city)
+                    flight_data = self.cached[to_city]
+                else:
+                    flight_data = futures[to_city].result()
                 if flight_data:
                     headers = ["From", "To", "Duration", "Airline & Price"]
                     print(f"\nTop 5 cheapest flights from {self.from_city} to {to_city}:")
-                    print(tabulate(flight_data, headers=headers, tablefmt="grid"))
+                    _print_table(flight_data, headers)
                 else:
                     print(f"No flights found for {self.from_city} to {to_city}")
             except Exception as e:
-                logging.error(f"Error with destination {to_city}: {e}")
+                logger.error("Error with destination %s: %s", to_city, e)
                 print(f"Failed to retrieve flights for {self.from_city} to {to_city}: {e}")
-            finally:
-                if i < len(self.to_cities) - 1:
-                    logging.info("Resetting form for next search")
-                    try:
-                        self.reset_form()
-                    except Exception as e:
-                        logging.warning(f"Form reset failed: {e}")
-                        self.driver.get("https://www.cleartrip.com/flights")
-                        self.wait.until(EC.presence_of_element_located((By.XPATH,
-                                                                        '//*[@id="__next"]/div/main/div/div[1]/div/div[1]/div[1]/div/div[1]/div[2]/div/div[2]/div/div[1]/input')))
-                self.wait = WebDriverWait(self.driver, 5)
-                time.sleep(2)
+
+    def close(self):
+        """Quit every browser in the pool."""
+        for searcher in self.searchers:
+            searcher.quit_driver()
 
 def main():
     """Main function to run the flight search automation."""
-    searcher = FlightSearcher()
+    cache = ResultCache()
+    pool = None
     try:
-        searcher.run()
+        pool = FlightSearchPool(cache=cache)
+        pool.run()
     finally:
-        searcher.quit_driver()
+        if pool:
+            pool.close()
+        cache.close()
 
 if __name__ == "__main__":
     main()